@@ -6,32 +6,87 @@ Provides a simulated touchscreen dashboard and API endpoints.
 """
 
 import os
+import re
 import sys
 import json
 import time
+import queue
 import logging
 import threading
-from datetime import datetime
+import dataclasses
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
 from pathlib import Path
 
-from flask import Flask, render_template, jsonify, request, send_from_directory
-from flask_cors import CORS
+import orjson
+from flask import Flask, Response, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from flask_sock import Sock
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from personas.survival.survival_persona import SurvivalPersona, SystemState
 
+# ==============================================================================
+# JSON Provider
+# ==============================================================================
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster API serialization."""
+
+    @staticmethod
+    def default(obj):
+        """Serialize persona enums and dataclasses."""
+        if isinstance(obj, Enum):
+            return obj.value
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            return dataclasses.asdict(obj)
+        return DefaultJSONProvider.default(obj)
+
+    def dumps(self, obj, **kwargs):
+        """Serialize data as JSON to a string using orjson."""
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize JSON from a string or bytes using orjson."""
+        return orjson.loads(s)
+
+
 # ==============================================================================
 # Flask Application
 # ==============================================================================
 
 app = Flask(__name__, static_folder='static', template_folder='templates')
-CORS(app)
+app.json = OrjsonProvider(app)
+# Compact, unsorted JSON even in debug mode (dashboard polls these endpoints)
+app.json.compact = True
+app.json.sort_keys = False
+sock = Sock(app)
 
 # Global persona instance
 persona = None
-boot_log = []
+boot_log = deque(maxlen=200)
+
+# Single background worker so boots never overlap
+_boot_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="boot")
+_boot_future = None
+_boot_lock = threading.Lock()
+# Upper bound for the simulated per-step delay accepted by /api/boot
+MAX_STEP_DELAY = 5.0
+
+# Per-connection queues for /ws/status push updates. Each open socket holds
+# a server thread for its lifetime, so cap them well below the thread count
+# documented in wsgi.py; extra clients are refused and should poll /api/status
+MAX_STATUS_SUBSCRIBERS = 4
+_status_subscribers = set()
+_status_subscribers_lock = threading.Lock()
 
 # Configure logging
 logging.basicConfig(
@@ -42,24 +97,66 @@ logging.basicConfig(
 logger = logging.getLogger("WebUI")
 
 
+# ==============================================================================
+# CORS
+# ==============================================================================
+
+@app.after_request
+def add_cors_headers(response):
+    """Allow cross-origin access from the dashboard."""
+    response.headers['Access-Control-Allow-Origin'] = '*'
+    if request.method == 'OPTIONS':
+        # Preflight; Flask answers OPTIONS for every route automatically
+        response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
+        response.headers['Access-Control-Allow-Headers'] = request.headers.get(
+            'Access-Control-Request-Headers', 'Content-Type')
+    return response
+
+
 # ==============================================================================
 # Boot Callbacks
 # ==============================================================================
 
 def on_boot_progress(step_name, boot_status):
     """Callback for boot progress updates."""
-    timestamp = datetime.now().strftime("%H:%M:%S")
+    now = time.localtime()
+    timestamp = f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
     boot_log.append({
         "time": timestamp,
         "step": step_name,
         "status": "in_progress"
     })
-    logger.info(f"Boot progress: {step_name}")
+    logger.debug("Boot progress: %s", step_name)
+    current = persona
+    if current:
+        publish_status(current.get_status())
 
 
 def on_state_change(status):
     """Callback for system state changes."""
-    logger.info(f"State changed to: {status['state']}")
+    logger.info("State changed to: %s", status['state'])
+    publish_status(status)
+
+
+def publish_status(status):
+    """Push a status snapshot to all /ws/status subscribers."""
+    with _status_subscribers_lock:
+        subscribers = list(_status_subscribers)
+    if not subscribers:
+        return
+
+    message = app.json.dumps({**status, 'boot_log': list(boot_log)})
+    for updates in subscribers:
+        # Slow client: drop its oldest queued snapshot so the latest always lands
+        while True:
+            try:
+                updates.put_nowait(message)
+                break
+            except queue.Full:
+                try:
+                    updates.get_nowait()
+                except queue.Empty:
+                    pass
 
 
 # ==============================================================================
@@ -106,37 +203,111 @@ def settings_page():
 # Routes - API
 # ==============================================================================
 
+# Simulated sensor readings, pre-serialized without the closing brace so
+# api_sensors only has to encode the GPS block per request
+_SENSORS_STATIC = orjson.dumps({
+    "temperature": {
+        "value": 23.5,
+        "unit": "C",
+        "source": "BME280"
+    },
+    "humidity": {
+        "value": 65,
+        "unit": "%",
+        "source": "BME280"
+    },
+    "pressure": {
+        "value": 1013.25,
+        "unit": "hPa",
+        "source": "BME280"
+    },
+    "heart_rate": {
+        "value": 72,
+        "unit": "bpm",
+        "source": "MAX30102"
+    },
+    "spo2": {
+        "value": 98,
+        "unit": "%",
+        "source": "MAX30102"
+    },
+    "body_temp": {
+        "value": 36.8,
+        "unit": "C",
+        "source": "MLX90614"
+    },
+})[:-1]
+
+# Voice command intents in priority order: (keywords, action, response)
+_VOICE_INTENTS = (
+    (("emergency", "sos", "help"), "emergency",
+     "Activating emergency mode. SOS beacon enabled."),
+    (("weather",), "weather",
+     "Current conditions: 23.5C, 65% humidity, 1013 hPa. No storms expected."),
+    (("location", "where"), "navigation",
+     "Your current position is being displayed on the map."),
+    (("medical", "first aid"), "medical",
+     "Opening medical protocols. What injury or condition do you need help with?"),
+)
+_INTENT_PRIORITY = {
+    keyword: priority
+    for priority, (keywords, _, _) in enumerate(_VOICE_INTENTS)
+    for keyword in keywords
+}
+# Zero-width lookahead so findall reports overlapping keywords too
+# (e.g. "where" must not hide "emergency" in "wheremergency")
+_INTENT_RE = re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in _INTENT_PRIORITY) + "))")
+
+
 @app.route('/api/status')
 def api_status():
     """Get current system status."""
     if persona:
-        status = persona.get_status()
-        status['boot_log'] = boot_log
-        return jsonify(status)
+        # Read the epoch before the status so the ETag never claims newer data
+        etag = f"{persona.status_epoch}-{len(boot_log)}"
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = jsonify({**persona.get_status(), 'boot_log': list(boot_log)})
+        response.set_etag(etag, weak=True)
+        return response
     return jsonify({"error": "System not initialized", "state": "not_started"})
 
 
 @app.route('/api/boot', methods=['POST'])
 def api_boot():
     """Start the boot sequence."""
-    global persona, boot_log
-
-    boot_log = []
-
-    # Create new persona instance
-    persona = SurvivalPersona()
-    persona.add_boot_callback(on_boot_progress)
-    persona.add_state_callback(on_state_change)
-
-    # Run boot in a separate thread to not block
-    def run_boot():
-        try:
-            persona.boot(simulate=True)
-        except Exception as e:
-            logger.error(f"Boot error: {e}")
-
-    thread = threading.Thread(target=run_boot)
-    thread.start()
+    global persona, _boot_future
+
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        return jsonify({"error": "Request body must be a JSON object"}), 400
+    step_delay = data.get('step_delay', 0)
+    if isinstance(step_delay, bool) or not isinstance(step_delay, (int, float)):
+        return jsonify({"error": "step_delay must be a number"}), 400
+    step_delay = float(step_delay)
+    if not 0 <= step_delay <= MAX_STEP_DELAY:
+        return jsonify({"error": f"step_delay must be between 0 and {MAX_STEP_DELAY}"}), 400
+
+    with _boot_lock:
+        if _boot_future and not _boot_future.done():
+            return jsonify({"message": "Boot sequence already running", "status": "already_booting"}), 409
+
+        boot_log.clear()
+
+        # Create new persona instance
+        persona = SurvivalPersona()
+        persona.add_boot_callback(on_boot_progress)
+        persona.add_state_callback(on_state_change)
+
+        # Run boot on the background worker to not block
+        def run_boot(booting_persona):
+            try:
+                booting_persona.boot(simulate=True, step_delay=step_delay)
+            except Exception as e:
+                logger.error("Boot error: %s", e)
+
+        _boot_future = _boot_executor.submit(run_boot, persona)
 
     return jsonify({"message": "Boot sequence started", "status": "booting"})
 
@@ -158,7 +329,7 @@ def api_boot_status():
             "battery_level": boot_status.battery_level,
             "gps_fix": boot_status.gps_fix,
             "errors": boot_status.errors,
-            "boot_log": boot_log,
+            "boot_log": list(boot_log),
             "boot_time": boot_status.boot_complete_time - boot_status.boot_start_time if boot_status.boot_complete_time else 0
         })
     return jsonify({"error": "System not initialized"})
@@ -168,45 +339,18 @@ def api_boot_status():
 def api_sensors():
     """Get sensor readings."""
     if persona:
-        # Return simulated sensor readings
-        return jsonify({
-            "temperature": {
-                "value": 23.5,
-                "unit": "C",
-                "source": "BME280"
-            },
-            "humidity": {
-                "value": 65,
-                "unit": "%",
-                "source": "BME280"
-            },
-            "pressure": {
-                "value": 1013.25,
-                "unit": "hPa",
-                "source": "BME280"
-            },
-            "heart_rate": {
-                "value": 72,
-                "unit": "bpm",
-                "source": "MAX30102"
-            },
-            "spo2": {
-                "value": 98,
-                "unit": "%",
-                "source": "MAX30102"
-            },
-            "body_temp": {
-                "value": 36.8,
-                "unit": "C",
-                "source": "MLX90614"
-            },
-            "gps": {
-                "latitude": -33.8688,
-                "longitude": 151.2093,
-                "altitude": 58,
-                "fix": persona.sensor_status.gps_fix if persona else False
-            }
+        # Return simulated sensor readings; only the GPS fix varies
+        gps = orjson.dumps({
+            "latitude": -33.8688,
+            "longitude": 151.2093,
+            "altitude": 58,
+            "fix": persona.sensor_status.gps_fix
         })
+        response = Response(_SENSORS_STATIC + b',"gps":' + gps + b'}', mimetype='application/json')
+        # Readings refresh at most ~1 Hz
+        response.cache_control.public = True
+        response.cache_control.max_age = 1
+        return response
     return jsonify({"error": "System not initialized"})
 
 
@@ -231,6 +375,7 @@ def api_emergency_activate():
     """Activate emergency SOS mode."""
     if persona:
         persona.state = SystemState.EMERGENCY
+        publish_status(persona.get_status())
         return jsonify({
             "status": "emergency_activated",
             "gps": {
@@ -247,6 +392,7 @@ def api_emergency_deactivate():
     """Deactivate emergency mode."""
     if persona:
         persona.state = SystemState.READY
+        publish_status(persona.get_status())
         return jsonify({"status": "emergency_deactivated"})
     return jsonify({"error": "System not initialized"})
 
@@ -265,32 +411,44 @@ def api_voice_command():
         "action": None
     }
 
-    # Basic command routing
-    command_lower = command.lower()
-    if "emergency" in command_lower or "sos" in command_lower or "help" in command_lower:
-        response["action"] = "emergency"
-        response["response"] = "Activating emergency mode. SOS beacon enabled."
-    elif "weather" in command_lower:
-        response["action"] = "weather"
-        response["response"] = "Current conditions: 23.5C, 65% humidity, 1013 hPa. No storms expected."
-    elif "location" in command_lower or "where" in command_lower:
-        response["action"] = "navigation"
-        response["response"] = "Your current position is being displayed on the map."
-    elif "medical" in command_lower or "first aid" in command_lower:
-        response["action"] = "medical"
-        response["response"] = "Opening medical protocols. What injury or condition do you need help with?"
+    # Basic command routing (one regex pass, highest-priority intent wins)
+    matches = _INTENT_RE.findall(command.lower())
+    if matches:
+        _, action, reply = _VOICE_INTENTS[min(_INTENT_PRIORITY[m] for m in matches)]
+        response["action"] = action
+        response["response"] = reply
 
     return jsonify(response)
 
 
 # ==============================================================================
-# Static Files
+# Routes - WebSocket
 # ==============================================================================
 
-@app.route('/static/<path:filename>')
-def serve_static(filename):
-    """Serve static files."""
-    return send_from_directory('static', filename)
+@sock.route('/ws/status')
+def ws_status(ws):
+    """Push system status on every state change instead of polling."""
+    updates = queue.Queue(maxsize=16)
+    with _status_subscribers_lock:
+        accepted = len(_status_subscribers) < MAX_STATUS_SUBSCRIBERS
+        if accepted:
+            _status_subscribers.add(updates)
+    if not accepted:
+        # 1013 "Try Again Later": keep threads free for plain HTTP requests
+        ws.close(reason=1013, message="Too many status subscribers; poll /api/status")
+        return
+
+    try:
+        if persona:
+            ws.send(app.json.dumps({**persona.get_status(), 'boot_log': list(boot_log)}))
+        while ws.connected:
+            try:
+                ws.send(updates.get(timeout=1))
+            except queue.Empty:
+                continue
+    finally:
+        with _status_subscribers_lock:
+            _status_subscribers.discard(updates)
 
 
 # ==============================================================================
@@ -324,6 +482,7 @@ if __name__ == '__main__':
     print("=" * 60)
     print("Starting development server...")
     print("Open http://localhost:5000 in your browser")
+    print("For production use: gunicorn -k gthread --threads 8 -w 1 -b 0.0.0.0:5000 wsgi:app")
     print("=" * 60 + "\n")
 
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
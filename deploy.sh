@@ -251,9 +251,12 @@ print_success "Python virtual environment created"
 remote_exec "cd ${PROJECT_ROOT} && source venv/bin/activate && pip install --upgrade pip"
 remote_exec "cd ${PROJECT_ROOT} && source venv/bin/activate && pip install \
     flask \
-    flask-cors \
+    flask-sock \
+    gunicorn \
+    orjson \
     requests \
     numpy \
+    numba \
     pyyaml \
     smbus2 \
     RPi.GPIO \
@@ -264,6 +267,11 @@ remote_exec "cd ${PROJECT_ROOT} && source venv/bin/activate && pip install \
 
 print_success "Python dependencies installed"
 
+# Pre-build a JSON copy of the config; the persona loads it instead of
+# parsing YAML whenever it is at least as new as the YAML file
+remote_exec "cd ${PROJECT_ROOT} && source venv/bin/activate && python3 -c 'import json, yaml; json.dump(yaml.safe_load(open(\"config/survival_config.yaml\")), open(\"config/survival_config.json\", \"w\"))'"
+print_success "Configuration JSON cache built"
+
 # -----------------------------------------------------------------------------
 # Stage 7: Database Initialization
 # -----------------------------------------------------------------------------
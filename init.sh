@@ -80,22 +80,22 @@ check_platform() {
 check_python() {
     print_step "Checking Python version..."
 
-    # Check for Python 3.9+
+    # Check for Python 3.10+ (slotted dataclasses)
     if command -v python3 &> /dev/null; then
         PYTHON_VERSION=$(python3 -c 'import sys; print(f"{sys.version_info.major}.{sys.version_info.minor}")')
         PYTHON_MAJOR=$(echo $PYTHON_VERSION | cut -d. -f1)
         PYTHON_MINOR=$(echo $PYTHON_VERSION | cut -d. -f2)
 
-        if [ "$PYTHON_MAJOR" -ge 3 ] && [ "$PYTHON_MINOR" -ge 9 ]; then
-            print_success "Python $PYTHON_VERSION found (requires 3.9+)"
+        if [ "$PYTHON_MAJOR" -ge 3 ] && [ "$PYTHON_MINOR" -ge 10 ]; then
+            print_success "Python $PYTHON_VERSION found (requires 3.10+)"
         else
-            print_error "Python 3.9+ required, found $PYTHON_VERSION"
-            echo "  Please install Python 3.9 or higher"
+            print_error "Python 3.10+ required, found $PYTHON_VERSION"
+            echo "  Please install Python 3.10 or higher"
             exit 1
         fi
     else
         print_error "Python3 not found"
-        echo "  Please install Python 3.9 or higher"
+        echo "  Please install Python 3.10 or higher"
         exit 1
     fi
     echo ""
@@ -181,7 +181,9 @@ install_dependencies() {
     pip install "pytest-cov>=4.1.0" > /dev/null 2>&1
     pip install "black>=23.0.0" > /dev/null 2>&1
     pip install "mypy>=1.5.0" > /dev/null 2>&1
-    print_success "Installed development tools (pytest, black, mypy)"
+    pip install "fastjsonschema>=2.18" > /dev/null 2>&1
+    pip install "hyperscan>=0.4.0" > /dev/null 2>&1 || true
+    print_success "Installed development tools (pytest, black, mypy, fastjsonschema)"
 
     echo ""
 }
@@ -417,7 +419,7 @@ llm:
 safety:
   enabled: true
   forbidden_patterns:
-    - "you have .* cancer"
+    - "you have (?:.* )?cancer"
     - "definitely .* disease"
     - "take \\d+ mg of"
     - "you will die"
@@ -642,7 +644,7 @@ class TestSafetyLayer:
         import re
 
         forbidden_patterns = [
-            r"you have .* cancer",
+            r"you have (?:.* )?cancer",
             r"definitely .* disease",
             r"take \d+ mg of",
             r"you will die",
@@ -0,0 +1,61 @@
+"""
+Survival Companion - Sensor Signal Processing
+=============================================
+Numeric helpers for sensor sampling (vitals smoothing, NMEA checks).
+
+Hot loops are compiled with Numba when it is installed; otherwise they
+run as plain Python. Call warmup() during boot so JIT compilation happens
+before the first live sample rather than on it.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def moving_average(samples, window):
+    """
+    Trailing moving average of a 1-D sample array.
+
+    The first window-1 outputs average over the samples seen so far.
+    Raises ValueError if window is less than 1.
+    """
+    if window < 1:
+        raise ValueError("window must be >= 1")
+    n = samples.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    total = 0.0
+    for i in range(n):
+        total += samples[i]
+        if i >= window:
+            total -= samples[i - window]
+            out[i] = total / window
+        else:
+            out[i] = total / (i + 1)
+    return out
+
+
+@njit(cache=True)
+def nmea_checksum(sentence):
+    """XOR checksum of an NMEA sentence body (uint8 array, without '$' and '*')."""
+    checksum = 0
+    for i in range(sentence.shape[0]):
+        checksum ^= sentence[i]
+    return checksum
+
+
+def warmup():
+    """Compile all kernels ahead of the first live sample."""
+    moving_average(np.zeros(8, dtype=np.float64), 3)
+    nmea_checksum(np.zeros(8, dtype=np.uint8))
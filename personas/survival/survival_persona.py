@@ -13,9 +13,13 @@ This module implements:
 
 import os
 import sys
+import json
 import time
 import logging
+import functools
+import itertools
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, Dict, Any, List, Callable
@@ -23,6 +27,12 @@ from pathlib import Path
 
 import yaml
 
+# Prefer the libyaml-backed loader when available
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 # ==============================================================================
 # Configuration and State Management
@@ -48,7 +58,7 @@ class MemoryState(Enum):
     VISION_ACTIVE = "vision_active"  # Hailo models (~3GB)
 
 
-@dataclass
+@dataclass(slots=True)
 class BootStatus:
     """Boot sequence status tracking."""
     display_initialized: bool = False
@@ -66,7 +76,7 @@ class BootStatus:
     errors: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorStatus:
     """Status of all hardware sensors."""
     # I2C sensors
@@ -88,6 +98,34 @@ class SensorStatus:
     adc_ready: bool = False
 
 
+# Expected I2C devices: (address, name, SensorStatus flag set when found)
+I2C_DEVICES = (
+    (0x57, "MAX30102 (SpO2/HR)", "max30102_connected"),
+    (0x5A, "MLX90614 (Temperature)", "mlx90614_connected"),
+    (0x76, "BME280 (Environment)", "bme280_connected"),
+)
+
+# Process-wide counter so status epochs are unique across persona instances
+_status_epochs = itertools.count(1)
+
+# Shared workers for concurrent boot steps (sized for the widest stage), so
+# repeated boots reuse threads instead of starting a pool each time
+_boot_step_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="boot-step")
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_pi_hardware() -> bool:
+    """Detect if running on actual Raspberry Pi hardware (cached per process)."""
+    try:
+        if os.path.exists("/proc/device-tree/model"):
+            with open("/proc/device-tree/model", "r") as f:
+                model = f.read()
+                return "Raspberry Pi" in model
+    except Exception:
+        pass
+    return False
+
+
 # ==============================================================================
 # Main Survival Persona Class
 # ==============================================================================
@@ -109,6 +147,8 @@ class SurvivalPersona:
         """Initialize the Survival Companion persona."""
         self.config_path = Path(config_path)
         self.config: Dict[str, Any] = {}
+        self._status_epoch = next(_status_epochs)
+        self._status_cache: Optional[tuple] = None
         self.state = SystemState.BOOTING
         self.memory_state = MemoryState.IDLE
         self.boot_status = BootStatus()
@@ -129,34 +169,65 @@ class SurvivalPersona:
         # Logging
         self.logger = logging.getLogger("SurvivalPersona")
 
+        # Simulated per-step delay (set by boot)
+        self.step_delay = 0.0
+
         # Development mode detection
-        self.is_pi_hardware = self._detect_pi_hardware()
+        self.is_pi_hardware = _detect_pi_hardware()
 
-    def _detect_pi_hardware(self) -> bool:
-        """Detect if running on actual Raspberry Pi hardware."""
-        try:
-            if os.path.exists("/proc/device-tree/model"):
-                with open("/proc/device-tree/model", "r") as f:
-                    model = f.read()
-                    return "Raspberry Pi" in model
-        except Exception:
-            pass
-        return False
+    @property
+    def state(self) -> SystemState:
+        """Current system state."""
+        return self._state
+
+    @state.setter
+    def state(self, value: SystemState):
+        self._state = value
+        self._touch_status()
+
+    @property
+    def memory_state(self) -> MemoryState:
+        """Current LLM memory state."""
+        return self._memory_state
+
+    @memory_state.setter
+    def memory_state(self, value: MemoryState):
+        self._memory_state = value
+        self._touch_status()
+
+    @property
+    def status_epoch(self) -> int:
+        """Counter that changes whenever the reported status may have changed."""
+        return self._status_epoch
+
+    def _touch_status(self):
+        """Mark the status snapshot as changed (call after mutating status)."""
+        self._status_epoch = next(_status_epochs)
 
     def _load_config(self) -> bool:
-        """Load configuration from YAML file."""
+        """Load configuration from YAML file (or its pre-built JSON cache)."""
         try:
             if self.config_path.exists():
-                with open(self.config_path, "r") as f:
-                    self.config = yaml.safe_load(f)
-                self.logger.info(f"Loaded configuration from {self.config_path}")
+                json_path = self.config_path.with_suffix(".json")
+                if (json_path.exists()
+                        and json_path.stat().st_mtime >= self.config_path.stat().st_mtime):
+                    try:
+                        self.config = json.loads(json_path.read_bytes())
+                        self.logger.debug("Loaded configuration from %s", json_path)
+                        return True
+                    except (OSError, ValueError) as e:
+                        # Stale or half-written cache; the YAML is authoritative
+                        self.logger.warning("Ignoring unreadable config cache %s: %s", json_path, e)
+                with open(self.config_path, "rb") as f:
+                    self.config = yaml.load(f, Loader=YamlLoader)
+                self.logger.debug("Loaded configuration from %s", self.config_path)
                 return True
             else:
-                self.logger.warning(f"Config file not found: {self.config_path}")
+                self.logger.warning("Config file not found: %s", self.config_path)
                 self._use_default_config()
                 return True
         except Exception as e:
-            self.logger.error(f"Error loading config: {e}")
+            self.logger.error("Error loading config: %s", e)
             self._use_default_config()
             return True
 
@@ -173,17 +244,19 @@ class SurvivalPersona:
     # Boot Sequence
     # ==========================================================================
 
-    def boot(self, simulate: bool = False) -> bool:
+    def boot(self, simulate: bool = False, step_delay: float = 0.0) -> bool:
         """
         Execute the boot sequence.
 
         Args:
             simulate: If True, simulates hardware for development
+            step_delay: Seconds to pause per simulated step (demo mode only)
 
         Returns:
             True if boot completed successfully
         """
         self.boot_status.boot_start_time = time.time()
+        self.step_delay = step_delay
         self.state = SystemState.BOOTING
         self._notify_state_change()
 
@@ -191,33 +264,32 @@ class SurvivalPersona:
         self.logger.info("SURVIVAL COMPANION - Boot Sequence Started")
         self.logger.info("=" * 60)
 
-        steps = [
-            ("Loading configuration", self._boot_load_config),
-            ("Initializing display", self._boot_display),
-            ("Scanning I2C devices", self._boot_i2c_scan),
-            ("Initializing sensors", self._boot_sensors),
-            ("Initializing GPS", self._boot_gps),
-            ("Warming up LLM", self._boot_llm),
-            ("Activating wake word", self._boot_wake_word),
-            ("Loading dashboard", self._boot_dashboard),
+        # Steps grouped into stages; steps within a stage touch independent
+        # hardware and run concurrently, stages run in order
+        stages = [
+            [("Loading configuration", self._boot_load_config)],
+            [
+                ("Initializing display", self._boot_display),
+                ("Scanning I2C devices", self._boot_i2c_scan),
+                ("Initializing GPS", self._boot_gps),
+                ("Activating wake word", self._boot_wake_word),
+            ],
+            [("Initializing sensors", self._boot_sensors)],
+            [("Warming up LLM", self._boot_llm)],
+            [("Loading dashboard", self._boot_dashboard)],
         ]
 
-        for step_name, step_func in steps:
-            self.logger.info(f"[BOOT] {step_name}...")
-            self._notify_boot_progress(step_name)
-
-            try:
-                if simulate or not self.is_pi_hardware:
-                    # Simulated boot for development
-                    time.sleep(0.3)  # Simulate processing time
-                    step_func(simulate=True)
-                else:
-                    step_func(simulate=False)
-            except Exception as e:
-                error_msg = f"Error during '{step_name}': {str(e)}"
-                self.logger.error(error_msg)
-                self.boot_status.errors.append(error_msg)
-                # Continue boot even on non-critical errors
+        for stage in stages:
+            if len(stage) == 1:
+                self._run_boot_step(*stage[0], simulate=simulate)
+            else:
+                futures = [
+                    _boot_step_pool.submit(self._run_boot_step, step_name, step_func, simulate)
+                    for step_name, step_func in stage
+                ]
+                # Wait for the whole stage and re-raise anything a step let escape
+                for future in futures:
+                    future.result()
 
         # Check boot completion
         self.boot_status.boot_complete_time = time.time()
@@ -225,13 +297,36 @@ class SurvivalPersona:
 
         if self.boot_status.dashboard_ready:
             self.state = SystemState.READY
-            self.logger.info(f"[BOOT] Complete in {boot_time:.1f} seconds")
+            self._notify_state_change()
+            self.logger.info("[BOOT] Complete in %.1f seconds", boot_time)
             self.logger.info("=" * 60)
             return True
         else:
             self.logger.error("[BOOT] Failed - dashboard not ready")
             return False
 
+    def _run_boot_step(self, step_name: str, step_func: Callable, simulate: bool = False):
+        """Run a single boot step, recording (not raising) any error."""
+        self.logger.debug("[BOOT] %s...", step_name)
+        self._notify_boot_progress(step_name)
+
+        try:
+            if simulate or not self.is_pi_hardware:
+                # Simulated boot for development
+                if self.step_delay:
+                    time.sleep(self.step_delay)  # Simulate processing time
+                step_func(simulate=True)
+            else:
+                step_func(simulate=False)
+        except Exception as e:
+            error_msg = f"Error during '{step_name}': {str(e)}"
+            self.logger.error(error_msg)
+            self.boot_status.errors.append(error_msg)
+            # Continue boot even on non-critical errors
+        finally:
+            # Boot steps update boot/sensor status in place
+            self._touch_status()
+
     def _boot_load_config(self, simulate: bool = False):
         """Boot step: Load configuration."""
         self._load_config()
@@ -240,7 +335,7 @@ class SurvivalPersona:
         """Boot step: Initialize display."""
         if simulate:
             self.boot_status.display_initialized = True
-            self.logger.info("  [SIM] Display initialized (480x320)")
+            self.logger.debug("  [SIM] Display initialized (480x320)")
         else:
             # Real hardware initialization would go here
             try:
@@ -255,40 +350,25 @@ class SurvivalPersona:
 
     def _boot_i2c_scan(self, simulate: bool = False):
         """Boot step: Scan I2C bus for devices."""
-        expected_devices = {
-            0x57: "MAX30102 (SpO2/HR)",
-            0x5A: "MLX90614 (Temperature)",
-            0x76: "BME280 (Environment)",
-        }
-
         if simulate:
             # Simulate finding all devices
-            for addr, name in expected_devices.items():
+            for addr, name, attr in I2C_DEVICES:
                 self.boot_status.i2c_devices_detected.append(f"{name} at 0x{addr:02X}")
-                self.logger.info(f"  [SIM] Found {name} at 0x{addr:02X}")
-
-            self.sensor_status.max30102_connected = True
-            self.sensor_status.mlx90614_connected = True
-            self.sensor_status.bme280_connected = True
+                self.logger.debug("  [SIM] Found %s at 0x%02X", name, addr)
+                setattr(self.sensor_status, attr, True)
         else:
             # Real I2C scan would go here
             try:
                 import smbus2
                 bus = smbus2.SMBus(1)
-                for addr, name in expected_devices.items():
+                for addr, name, attr in I2C_DEVICES:
                     try:
                         bus.read_byte(addr)
                         self.boot_status.i2c_devices_detected.append(f"{name} at 0x{addr:02X}")
-                        self.logger.info(f"  Found {name} at 0x{addr:02X}")
-
-                        if addr == 0x57:
-                            self.sensor_status.max30102_connected = True
-                        elif addr == 0x5A:
-                            self.sensor_status.mlx90614_connected = True
-                        elif addr == 0x76:
-                            self.sensor_status.bme280_connected = True
+                        self.logger.debug("  Found %s at 0x%02X", name, addr)
+                        setattr(self.sensor_status, attr, True)
                     except Exception:
-                        self.logger.warning(f"  Device not found: {name} at 0x{addr:02X}")
+                        self.logger.warning("  Device not found: %s at 0x%02X", name, addr)
                 bus.close()
             except ImportError:
                 self.logger.warning("  smbus2 not available, skipping I2C scan")
@@ -299,11 +379,17 @@ class SurvivalPersona:
             self.boot_status.sensors_initialized = True
             self.sensor_status.adc_ready = True
             self.sensor_status.camera_ready = True
-            self.logger.info("  [SIM] All sensors initialized")
+            self.logger.debug("  [SIM] All sensors initialized")
         else:
             # Real sensor initialization
+            try:
+                # Pay DSP JIT compilation now rather than on the first sample
+                from personas.survival.sensors import dsp
+                dsp.warmup()
+            except ImportError:
+                self.logger.warning("  DSP dependencies not available, skipping warm-up")
             self.boot_status.sensors_initialized = True
-            self.logger.info("  Sensors initialized")
+            self.logger.debug("  Sensors initialized")
 
     def _boot_gps(self, simulate: bool = False):
         """Boot step: Initialize GPS module."""
@@ -312,59 +398,70 @@ class SurvivalPersona:
             self.sensor_status.gps_connected = True
             # Simulate no initial fix (cold start)
             self.sensor_status.gps_fix = False
-            self.logger.info("  [SIM] GPS initialized (awaiting fix)")
+            self.logger.debug("  [SIM] GPS initialized (awaiting fix)")
         else:
             try:
                 # Real GPS initialization
                 self.boot_status.gps_initialized = True
                 self.sensor_status.gps_connected = True
-                self.logger.info("  GPS initialized")
+                self.logger.debug("  GPS initialized")
             except Exception as e:
-                self.logger.warning(f"  GPS initialization failed: {e}")
+                self.logger.warning("  GPS initialization failed: %s", e)
 
     def _boot_llm(self, simulate: bool = False):
         """Boot step: Warm up LLM model."""
         if simulate:
             self.boot_status.llm_warming_up = True
-            time.sleep(0.5)  # Simulate warm-up time
+            if self.step_delay:
+                time.sleep(self.step_delay)  # Simulate warm-up time
             self.boot_status.llm_ready = True
             self.boot_status.llm_warming_up = False
-            self.logger.info("  [SIM] LLM ready (Phi-3-mini)")
+            self.logger.debug("  [SIM] LLM ready (Phi-3-mini)")
         else:
             # Real LLM loading would go here
             self.boot_status.llm_warming_up = True
             # LLM is loaded on-demand to save memory
             self.boot_status.llm_ready = True
             self.boot_status.llm_warming_up = False
-            self.logger.info("  LLM ready")
+            self.logger.debug("  LLM ready")
 
     def _boot_wake_word(self, simulate: bool = False):
         """Boot step: Activate wake word detection."""
         if simulate:
             self.boot_status.wake_word_active = True
             wake_words = self.config.get("voice", {}).get("wake_words", ["survival", "companion"])
-            self.logger.info(f"  [SIM] Wake word active: {wake_words}")
+            self.logger.debug("  [SIM] Wake word active: %s", wake_words)
         else:
             # Real wake word initialization
             self.boot_status.wake_word_active = True
-            self.logger.info("  Wake word detector active")
+            self.logger.debug("  Wake word detector active")
 
     def _boot_dashboard(self, simulate: bool = False):
         """Boot step: Load main dashboard."""
         if simulate:
             self.boot_status.dashboard_ready = True
-            self.logger.info("  [SIM] Dashboard ready")
+            self.logger.debug("  [SIM] Dashboard ready")
         else:
             self.boot_status.dashboard_ready = True
-            self.logger.info("  Dashboard ready")
+            self.logger.debug("  Dashboard ready")
 
     # ==========================================================================
     # State Management
     # ==========================================================================
 
     def get_status(self) -> Dict[str, Any]:
-        """Get current system status for display."""
-        return {
+        """
+        Get current system status for display.
+
+        The snapshot is cached until the status epoch changes, so callers
+        share it and must not modify it.
+        """
+        epoch = self._status_epoch
+        cached = self._status_cache
+        if cached is not None and cached[0] == epoch:
+            return cached[1]
+
+        status = {
             "state": self.state.value,
             "memory_state": self.memory_state.value,
             "boot_status": {
@@ -388,6 +485,8 @@ class SurvivalPersona:
             },
             "is_ready": self.state == SystemState.READY,
         }
+        self._status_cache = (epoch, status)
+        return status
 
     def add_state_callback(self, callback: Callable):
         """Add callback for state changes."""
@@ -399,20 +498,24 @@ class SurvivalPersona:
 
     def _notify_state_change(self):
         """Notify all state change callbacks."""
+        if not self._state_callbacks:
+            return
         status = self.get_status()
         for callback in self._state_callbacks:
             try:
                 callback(status)
             except Exception as e:
-                self.logger.error(f"State callback error: {e}")
+                self.logger.error("State callback error: %s", e)
 
     def _notify_boot_progress(self, step_name: str):
         """Notify boot progress callbacks."""
+        if not self._boot_callbacks:
+            return
         for callback in self._boot_callbacks:
             try:
                 callback(step_name, self.boot_status)
             except Exception as e:
-                self.logger.error(f"Boot callback error: {e}")
+                self.logger.error("Boot callback error: %s", e)
 
     # ==========================================================================
     # Power Management
@@ -421,17 +524,18 @@ class SurvivalPersona:
     def set_battery_level(self, level: int):
         """Update battery level and adjust power state if needed."""
         self.boot_status.battery_level = max(0, min(100, level))
+        self._touch_status()
 
         low_threshold = self.config.get("power", {}).get("low_battery_threshold", 20)
         critical_threshold = self.config.get("power", {}).get("critical_battery_threshold", 10)
 
         if self.boot_status.battery_level <= critical_threshold:
             if self.state != SystemState.EMERGENCY:
-                self.logger.warning(f"CRITICAL BATTERY: {level}% - Emergency beacon only")
+                self.logger.warning("CRITICAL BATTERY: %s%% - Emergency beacon only", level)
                 # Keep running but warn
         elif self.boot_status.battery_level <= low_threshold:
             if self.state != SystemState.LOW_POWER:
-                self.logger.warning(f"LOW BATTERY: {level}% - Reducing features")
+                self.logger.warning("LOW BATTERY: %s%% - Reducing features", level)
                 self.state = SystemState.LOW_POWER
                 self._notify_state_change()
 
@@ -0,0 +1,144 @@
+"""
+Integration tests for the Flask web interface
+Run with: pytest tests/ -v
+"""
+import json
+import queue
+
+import pytest
+
+import app as webapp
+from personas.survival.survival_persona import SurvivalPersona
+
+
+@pytest.fixture
+def client():
+    """Flask test client for the dashboard app."""
+    return webapp.app.test_client()
+
+
+@pytest.fixture
+def persona(monkeypatch):
+    """Fresh (unbooted) persona installed as the app's global instance."""
+    instance = SurvivalPersona()
+    monkeypatch.setattr(webapp, "persona", instance)
+    return instance
+
+
+def _boot_display_step(persona, client):
+    """Run one simulated boot step."""
+    persona._run_boot_step("Initializing display", persona._boot_display, simulate=True)
+
+
+def _activate_emergency(persona, client):
+    """Switch to emergency mode through the API."""
+    client.post("/api/emergency/activate")
+
+
+def _drain_battery(persona, client):
+    """Change the battery level without changing the power state."""
+    persona.set_battery_level(50)
+
+
+class TestStatusETag:
+    """Tests for conditional GETs on /api/status."""
+
+    def test_unchanged_status_not_modified(self, client, persona):
+        """Verify a repeated request with the current ETag gets a 304."""
+        first = client.get("/api/status")
+        assert first.status_code == 200 and first.headers["ETag"]
+
+        second = client.get("/api/status", headers={"If-None-Match": first.headers["ETag"]})
+        assert second.status_code == 304
+        assert second.headers["ETag"] == first.headers["ETag"]
+
+    @pytest.mark.parametrize("change,field,value", [
+        (_boot_display_step, "display", True),
+        (_activate_emergency, "state", "emergency"),
+        (_drain_battery, "battery", 50),
+    ], ids=["boot_step", "emergency_activate", "battery_level"])
+    def test_status_change_new_etag(self, client, persona, change, field, value):
+        """Verify every status change invalidates the previous ETag."""
+        etag = client.get("/api/status").headers["ETag"]
+
+        change(persona, client)
+
+        response = client.get("/api/status", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        status = response.get_json()
+        assert status.get(field, status["boot_status"].get(field)) == value
+
+
+class _FakeSocket:
+    """Stand-in for a flask-sock connection that records what it is sent."""
+
+    def __init__(self):
+        self.connected = True
+        self.sent = []
+        self.closed_with = None
+
+    def send(self, data):
+        self.sent.append(data)
+
+    def close(self, reason=None, message=None):
+        self.connected = False
+        self.closed_with = reason
+
+
+class TestStatusPush:
+    """Tests for /ws/status push updates."""
+
+    @pytest.fixture
+    def subscribers(self, monkeypatch):
+        """Empty subscriber set for the duration of a test."""
+        monkeypatch.setattr(webapp, "_status_subscribers", set())
+        return webapp._status_subscribers
+
+    def test_full_queue_drops_oldest(self, subscribers):
+        """Verify a slow subscriber keeps the newest snapshots, not the oldest."""
+        updates = queue.Queue(maxsize=3)
+        subscribers.add(updates)
+
+        for n in range(5):
+            webapp.publish_status({"state": f"state-{n}"})
+
+        received = [json.loads(updates.get_nowait())["state"] for _ in range(updates.qsize())]
+        assert received == ["state-2", "state-3", "state-4"]
+
+    def test_subscribers_capped(self, subscribers):
+        """Verify sockets beyond the cap are refused instead of holding a thread."""
+        for _ in range(webapp.MAX_STATUS_SUBSCRIBERS):
+            subscribers.add(queue.Queue())
+
+        ws = _FakeSocket()
+        # sock.route registers a wrapper that builds the real socket; call the handler
+        webapp.app.view_functions["ws_status"].__wrapped__(ws)
+
+        assert ws.closed_with == 1013
+        assert ws.sent == []
+        assert len(subscribers) == webapp.MAX_STATUS_SUBSCRIBERS
+
+
+class TestVoiceCommands:
+    """Tests for voice command intent routing."""
+
+    @pytest.mark.parametrize("command,action", [
+        ("What's the weather", "weather"),
+        ("Where am I", "navigation"),
+        ("I need first aid", "medical"),
+        ("Help me", "emergency"),
+        ("Sing a song", None),
+        # Higher-priority intent wins regardless of word order
+        ("Where is the nearest medical kit", "navigation"),
+        ("Medical emergency", "emergency"),
+        ("Weather at my location", "weather"),
+        # Overlapping keywords must all be seen
+        ("wheremergency", "emergency"),
+        ("locationsos", "emergency"),
+    ])
+    def test_intent_routing(self, client, command, action):
+        """Verify commands route to the highest-priority matching intent."""
+        response = client.post("/api/voice/command", json={"command": command})
+        assert response.status_code == 200
+        assert response.get_json()["action"] == action
@@ -4,11 +4,181 @@ Run with: pytest tests/ -v
 """
 import pytest
 import os
+import re
+import mmap
+from pathlib import Path
+
+import fastjsonschema
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+SURVIVAL_DIR = Path("personas/survival")
+
+# Top-level sections every config must define
+REQUIRED_TOP = frozenset({"system", "voice", "llm", "safety"})
+
+# Config schema, compiled once into a specialized validator function
+_CONFIG_SCHEMA = {
+    "type": "object",
+    "required": sorted(REQUIRED_TOP | {"memory"}),
+    "properties": {
+        "safety": {
+            "type": "object",
+            "required": ["enabled", "forbidden_patterns", "required_disclaimers"],
+            "properties": {
+                "enabled": {"const": True},
+                "forbidden_patterns": {"type": "array", "minItems": 1},
+            },
+        },
+        "memory": {
+            "type": "object",
+            "required": ["max_ram_usage_mb"],
+            "properties": {
+                # Within Pi 5 capacity, but enough for LLM operation
+                "max_ram_usage_mb": {"type": "integer", "minimum": 4000, "maximum": 8000},
+            },
+        },
+    },
+}
+_validate_config = fastjsonschema.compile(_CONFIG_SCHEMA)
+
+# Dangerous phrases, each with the configured pattern that must block it
+DANGEROUS_PHRASES = (
+    ("you have cancer", r"you have (?:.* )?cancer"),
+    ("you have skin cancer", r"you have (?:.* )?cancer"),
+    ("definitely heart disease", r"definitely .* disease"),
+    ("take 500 mg of ibuprofen", r"take \d+ mg of"),
+    ("you will die", r"you will die"),
+)
+_BLOCKING_PATTERN = dict(DANGEROUS_PHRASES)
+
+SAFE_PHRASES = (
+    "I'm concerned about this mole",
+    "This shows signs that warrant professional evaluation",
+    "General guidance suggests rest and hydration",
+    "Seek medical attention if symptoms persist",
+)
+
+# Literal each forbidden pattern requires; phrases containing none of them
+# cannot match (test_prefilter_covers_pattern checks this against the config)
+_FORBIDDEN_LITERALS = ("cancer", "disease", "mg of", "you will die")
+
+# Hyperscan matches all patterns in a single DFA pass when available
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+_ENGINE_PARAMS = [
+    "re",
+    pytest.param("hyperscan", marks=pytest.mark.skipif(hyperscan is None, reason="hyperscan not installed")),
+]
+
+
+def _compile_engines(patterns):
+    """Compile the forbidden patterns once for each available scan engine.
+
+    The re engine fuses them into one alternation so each phrase is scanned
+    once. Patterns are lowercase and phrases are lowercased before scanning,
+    so neither engine folds case; re.ASCII keeps \\d to 0-9 as in Hyperscan.
+    """
+    fused = re.compile("|".join(patterns), re.ASCII)
+    engines = {"re": lambda phrase: bool(fused.search(phrase))}
+
+    if hyperscan is not None:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.encode() for pattern in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns),
+        )
+
+        def match_hyperscan(phrase):
+            hits = []
+            database.scan(phrase.encode(), match_event_handler=lambda pattern_id, *_: hits.append(pattern_id))
+            return bool(hits)
+
+        engines["hyperscan"] = match_hyperscan
+    return engines
+
+
+def _scan(match, phrase):
+    """Return True if the phrase matches any forbidden pattern, per the match engine."""
+    phrase = phrase.lower()
+    if not any(literal in phrase for literal in _FORBIDDEN_LITERALS):
+        return False
+    return match(phrase)
+
+
+def _read_config(pytest_config):
+    """Parse survival_config.yaml, reusing the pytest cache until it changes.
+
+    The parse is kept in the pytest cache (not next to the config, where the
+    persona would pick it up) and keyed on the YAML's mtime.
+    """
+    yaml_path = "config/survival_config.yaml"
+    mtime_ns = os.stat(yaml_path).st_mtime_ns
+
+    cache = getattr(pytest_config, "cache", None)
+    if cache is not None:
+        cached = cache.get("survival/config", None)
+        if cached and cached.get("mtime_ns") == mtime_ns:
+            return cached["config"]
+
+    with open(yaml_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            config = yaml.load(m, Loader=_Loader)
+    if cache is not None:
+        cache.set("survival/config", {"mtime_ns": mtime_ns, "config": config})
+    return config
+
+
+def pytest_generate_tests(metafunc):
+    """Give each configured forbidden pattern its own test ID.
+
+    Collection runs before fixtures, so this reads the config directly.
+    """
+    if "forbidden_pattern" in metafunc.fixturenames:
+        patterns = _read_config(metafunc.config)["safety"]["forbidden_patterns"]
+        metafunc.parametrize("forbidden_pattern", patterns)
+
+
+@pytest.fixture(scope="session")
+def survival_config(request):
+    """Parsed survival config, shared across the test session.
+
+    Tests must not mutate it.
+    """
+    return _read_config(request.config)
+
+
+@pytest.fixture(scope="session")
+def forbidden_patterns(survival_config):
+    """Medical safety layer patterns, as configured."""
+    return tuple(survival_config["safety"]["forbidden_patterns"])
+
 
+@pytest.fixture(scope="session")
+def compiled_patterns(forbidden_patterns):
+    """Each forbidden pattern compiled on its own, for checking it in isolation."""
+    return {pattern: re.compile(pattern, re.ASCII) for pattern in forbidden_patterns}
 
-def test_placeholder():
-    """Placeholder test - remove when real tests are added."""
-    assert True
+
+@pytest.fixture(scope="session")
+def scan_engines(forbidden_patterns):
+    """Forbidden patterns compiled for each available scan engine."""
+    return _compile_engines(forbidden_patterns)
+
+
+@pytest.fixture(scope="session")
+def survival_subdirs():
+    """Names of directories directly under personas/survival, listed once."""
+    return frozenset(p.name for p in SURVIVAL_DIR.iterdir() if p.is_dir())
 
 
 class TestProjectStructure:
@@ -23,112 +193,60 @@ class TestProjectStructure:
         assert os.path.exists("personas/__init__.py")
         assert os.path.exists("personas/survival/__init__.py")
 
-    def test_module_directories(self):
-        """Verify all module directories exist."""
-        modules = [
-            "personas/survival/medical",
-            "personas/survival/vision",
-            "personas/survival/navigation",
-            "personas/survival/survival",
-            "personas/survival/emergency",
-            "personas/survival/voice",
-            "personas/survival/ui",
-            "personas/survival/sensors",
-        ]
-        for module in modules:
-            assert os.path.isdir(module), f"Module directory {module} should exist"
+    @pytest.mark.parametrize("module", [
+        "medical",
+        "vision",
+        "navigation",
+        "survival",
+        "emergency",
+        "voice",
+        "ui",
+        "sensors",
+    ])
+    def test_module_directory(self, module, survival_subdirs):
+        """Verify each module directory exists."""
+        assert module in survival_subdirs, f"Module directory {SURVIVAL_DIR / module} should exist"
 
 
 class TestSafetyLayer:
     """Tests for medical safety layer."""
 
-    @pytest.mark.parametrize("dangerous_phrase", [
-        "you have cancer",
-        "definitely heart disease",
-        "take 500 mg of ibuprofen",
-        "you will die",
+    @pytest.mark.parametrize("phrase,expected", [
+        *((phrase, True) for phrase, _ in DANGEROUS_PHRASES),
+        *((phrase, False) for phrase in SAFE_PHRASES),
     ])
-    def test_forbidden_patterns_blocked(self, dangerous_phrase):
-        """Verify dangerous patterns would be caught."""
-        import re
-
-        forbidden_patterns = [
-            r"you have .* cancer",
-            r"definitely .* disease",
-            r"take \d+ mg of",
-            r"you will die",
-        ]
-
-        matched = any(
-            re.search(pattern, dangerous_phrase, re.IGNORECASE)
-            for pattern in forbidden_patterns
-        )
-
-        assert matched, f"Pattern '{dangerous_phrase}' should be blocked"
-
-    @pytest.mark.parametrize("safe_phrase", [
-        "I'm concerned about this mole",
-        "This shows signs that warrant professional evaluation",
-        "General guidance suggests rest and hydration",
-        "Seek medical attention if symptoms persist",
+    @pytest.mark.parametrize("engine", _ENGINE_PARAMS)
+    def test_phrase_screening(self, scan_engines, engine, phrase, expected):
+        """Verify dangerous phrases are blocked and safe phrases allowed."""
+        verdict = "should" if expected else "should NOT"
+        assert _scan(scan_engines[engine], phrase) == expected, f"Pattern '{phrase}' {verdict} be blocked"
+
+    @pytest.mark.parametrize("phrase", [
+        "take 500 mg of aspirin",
+        "take \u0665\u0660\u0660 mg of aspirin",  # Arabic-Indic digits
+        "take \uff15\uff10\uff10 mg of aspirin",  # fullwidth digits
+        "take 500mg of aspirin",
     ])
-    def test_safe_patterns_allowed(self, safe_phrase):
-        """Verify safe patterns are not blocked."""
-        import re
-
-        forbidden_patterns = [
-            r"you have .* cancer",
-            r"definitely .* disease",
-            r"take \d+ mg of",
-            r"you will die",
-        ]
-
-        matched = any(
-            re.search(pattern, safe_phrase, re.IGNORECASE)
-            for pattern in forbidden_patterns
-        )
+    @pytest.mark.parametrize("engine", _ENGINE_PARAMS)
+    def test_prefilter_agrees_with_patterns(self, scan_engines, engine, phrase):
+        """Verify the literal prefilter never rejects a phrase the patterns match."""
+        match = scan_engines[engine]
+        assert _scan(match, phrase) == match(phrase.lower())
+
+    def test_prefilter_covers_pattern(self, forbidden_pattern):
+        """Verify each configured pattern requires one of the prefilter literals."""
+        assert any(literal in forbidden_pattern for literal in _FORBIDDEN_LITERALS)
 
-        assert not matched, f"Pattern '{safe_phrase}' should NOT be blocked"
+    @pytest.mark.parametrize("phrase", [*_BLOCKING_PATTERN, *SAFE_PHRASES])
+    def test_pattern_isolation(self, compiled_patterns, forbidden_pattern, phrase):
+        """Verify each pattern matches exactly the dangerous phrases it targets."""
+        expected = _BLOCKING_PATTERN.get(phrase) == forbidden_pattern
+        assert bool(compiled_patterns[forbidden_pattern].search(phrase.lower())) == expected
 
 
 class TestConfigValidation:
     """Tests for configuration file validation."""
 
-    def test_config_is_valid_yaml(self):
-        """Verify config file is valid YAML."""
-        import yaml
-
-        with open("config/survival_config.yaml", "r") as f:
-            config = yaml.safe_load(f)
-
-        assert config is not None
-        assert "system" in config
-        assert "voice" in config
-        assert "llm" in config
-        assert "safety" in config
-
-    def test_safety_config_complete(self):
-        """Verify safety configuration is complete."""
-        import yaml
-
-        with open("config/survival_config.yaml", "r") as f:
-            config = yaml.safe_load(f)
-
-        safety = config.get("safety", {})
-        assert safety.get("enabled") is True
-        assert "forbidden_patterns" in safety
-        assert len(safety["forbidden_patterns"]) > 0
-        assert "required_disclaimers" in safety
-
-    def test_memory_limits_reasonable(self):
-        """Verify memory limits are within Pi 5 capacity."""
-        import yaml
-
-        with open("config/survival_config.yaml", "r") as f:
-            config = yaml.safe_load(f)
-
-        memory = config.get("memory", {})
-        max_ram = memory.get("max_ram_usage_mb", 0)
-
-        assert max_ram <= 8000, "Max RAM should not exceed Pi 5 capacity"
-        assert max_ram >= 4000, "Max RAM should be reasonable for LLM operation"
+    def test_config(self, survival_config):
+        """Verify config structure, safety layer and memory limits."""
+        _validate_config(survival_config)
@@ -0,0 +1,54 @@
+"""
+Unit tests for sensor signal processing helpers
+Run with: pytest tests/ -v
+"""
+import numpy as np
+import pytest
+
+from personas.survival.sensors.dsp import moving_average, nmea_checksum
+
+
+class TestMovingAverage:
+    """Tests for the trailing moving average."""
+
+    def test_trailing_average(self):
+        """Verify full windows average the last window samples."""
+        out = moving_average(np.array([2.0, 4.0, 6.0, 8.0, 10.0]), 2)
+        np.testing.assert_allclose(out[1:], [3.0, 5.0, 7.0, 9.0])
+
+    def test_warmup_outputs_are_partial_averages(self):
+        """Verify the first window-1 outputs average the samples seen so far."""
+        out = moving_average(np.array([3.0, 6.0, 9.0, 12.0, 15.0]), 3)
+        np.testing.assert_allclose(out, [3.0, 4.5, 6.0, 9.0, 12.0])
+
+    def test_window_longer_than_samples(self):
+        """Verify a window longer than the input yields running means only."""
+        out = moving_average(np.array([1.0, 2.0, 3.0]), 10)
+        np.testing.assert_allclose(out, [1.0, 1.5, 2.0])
+
+    def test_window_one_is_identity(self):
+        """Verify a window of one returns the samples unchanged."""
+        samples = np.array([5.0, -1.0, 7.5])
+        np.testing.assert_allclose(moving_average(samples, 1), samples)
+
+    @pytest.mark.parametrize("window", [0, -1])
+    def test_invalid_window(self, window):
+        """Verify non-positive windows are rejected."""
+        with pytest.raises(ValueError, match="window must be >= 1"):
+            moving_average(np.ones(4), window)
+
+
+class TestNmeaChecksum:
+    """Tests for the NMEA sentence checksum."""
+
+    @pytest.mark.parametrize("body,expected", [
+        ("GPRMC,092750.000,A,5321.6802,N,00630.3372,W,0.02,31.66,280511,,,A", 0x43),
+        ("GPGGA,092750.000,5321.6802,N,00630.3372,W,1,8,1.03,61.7,M,55.2,M,,", 0x76),
+    ])
+    def test_known_sentences(self, body, expected):
+        """Verify checksums of real GPS sentences."""
+        assert nmea_checksum(np.frombuffer(body.encode(), dtype=np.uint8)) == expected
+
+    def test_empty_sentence(self):
+        """Verify an empty body checksums to zero."""
+        assert nmea_checksum(np.zeros(0, dtype=np.uint8)) == 0
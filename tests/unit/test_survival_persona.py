@@ -0,0 +1,77 @@
+"""
+Unit tests for the SurvivalPersona core
+Run with: pytest tests/ -v
+"""
+import json
+import os
+
+import pytest
+
+from personas.survival.survival_persona import SurvivalPersona
+
+
+@pytest.fixture
+def config_yaml(tmp_path):
+    """Minimal survival config YAML in a temp directory."""
+    path = tmp_path / "survival_config.yaml"
+    path.write_text("system:\n  persona_name: From YAML\nsafety:\n  enabled: true\n")
+    return path
+
+
+def _write_cache(config_yaml, content, offset):
+    """Write the JSON cache next to the YAML, offset seconds from its mtime."""
+    json_path = config_yaml.with_suffix(".json")
+    json_path.write_text(content)
+    mtime = config_yaml.stat().st_mtime + offset
+    os.utime(json_path, (mtime, mtime))
+
+
+class TestConfigLoading:
+    """Tests for YAML config loading and its JSON cache."""
+
+    def test_fresh_cache_used(self, config_yaml):
+        """Verify a JSON cache at least as new as the YAML is preferred."""
+        _write_cache(config_yaml, json.dumps({"system": {"persona_name": "From JSON"}}), 10)
+        persona = SurvivalPersona(str(config_yaml))
+        persona._load_config()
+        assert persona.config["system"]["persona_name"] == "From JSON"
+
+    @pytest.mark.parametrize("content,offset", [
+        ('{"system": {"persona_na', 10),
+        ("", 10),
+        (json.dumps({"system": {"persona_name": "From JSON"}}), -10),
+    ], ids=["corrupt", "empty", "stale"])
+    def test_yaml_used_when_cache_unusable(self, config_yaml, content, offset):
+        """Verify a corrupt or stale cache falls back to the YAML, not defaults."""
+        _write_cache(config_yaml, content, offset)
+        persona = SurvivalPersona(str(config_yaml))
+        persona._load_config()
+        assert persona.config["system"]["persona_name"] == "From YAML"
+        assert persona.config["safety"]["enabled"] is True
+
+
+class TestBootSequence:
+    """Tests for the staged boot sequence."""
+
+    def test_boot_completes(self):
+        """Verify a simulated boot runs every stage and reaches READY."""
+        persona = SurvivalPersona()
+        assert persona.boot(simulate=True)
+        assert persona.state.value == "ready"
+        assert persona.boot_status.display_initialized
+        assert persona.boot_status.gps_initialized
+        assert persona.boot_status.wake_word_active
+
+    def test_concurrent_step_error_propagates(self, monkeypatch):
+        """Verify an exception escaping a concurrent boot step is not lost."""
+        persona = SurvivalPersona()
+        run_boot_step = persona._run_boot_step
+
+        def failing_step(step_name, step_func, simulate=False):
+            if step_name == "Initializing GPS":
+                raise RuntimeError("GPS step crashed")
+            return run_boot_step(step_name, step_func, simulate)
+
+        monkeypatch.setattr(persona, "_run_boot_step", failing_step)
+        with pytest.raises(RuntimeError, match="GPS step crashed"):
+            persona.boot(simulate=True)
@@ -0,0 +1,19 @@
+"""
+Survival Companion - WSGI Entry Point
+=====================================
+Production entry point for the Flask web interface.
+
+Run with:
+    gunicorn -k gthread --threads 8 -w 1 -b 0.0.0.0:5000 wsgi:app
+
+The persona and boot log live in process memory, so use a single worker
+process and scale with threads.
+
+Each /ws/status WebSocket occupies one of those threads for as long as it
+stays open. app.MAX_STATUS_SUBSCRIBERS caps them at 4 so at least half the
+threads stay free for HTTP requests; raise --threads before raising the cap.
+"""
+
+from app import app
+
+__all__ = ["app"]